@@ -1,29 +1,148 @@
 import yfinance as yf
 import pandas as pd
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
 import os
 import json
+import time
+import pickle
+import hashlib
+import threading
 import feedparser
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from file_utils import atomic_write, dumps_json
 
 load_dotenv()
 
+# Upper bound on concurrent requests to a single upstream service
+MAX_FETCH_WORKERS = 16
+
+# Seconds before cached data is considered stale
+INTRADAY_HISTORY_TTL = 4 * 60 * 60
+NEWS_TTL = 60 * 60
+
+# Daily histories and financial metrics stay fresh until the next NSE close, so a
+# run at the same time each day never reuses the previous day's data
+IST = timezone(timedelta(hours=5, minutes=30))
+MARKET_CLOSE = (15, 30)
+
+# Relative difference between a cached and a re-downloaded close treated as rounding
+# rather than a change of adjustment basis
+ADJUSTMENT_TOLERANCE = 1e-4
+
+# How far back each timeframe reaches, for trimming incrementally updated history.
+# Timeframes not listed here are always downloaded in full.
+HISTORY_WINDOWS = {
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+}
+
+# CSV copies are for inspection only; prices need no more than 4 decimals
+CSV_FLOAT_FORMAT = "%.4f"
+
+def load_portfolio(file_path):
+    """Load portfolio from JSON file"""
+    with open(file_path, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
+def _last_market_close(now=None):
+    """Return the timestamp of the most recent weekday market close (exchange holidays are not skipped)"""
+    now = now or datetime.now(IST)
+    close = now.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1], second=0, microsecond=0)
+    if close > now:
+        close -= timedelta(days=1)
+    while close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close.timestamp()
+
 class DataCollector:
     def __init__(self, portfolio_file="portfolio.json"):
         """
         Initialize the data collector with your portfolio
-        portfolio_file: JSON file with stock symbols and quantities
+        portfolio_file: JSON file with stock symbols and quantities, or an
+                        already loaded portfolio dict
         """
-        self.portfolio = self._load_portfolio(portfolio_file)
+        if isinstance(portfolio_file, dict):
+            self.portfolio = portfolio_file
+        else:
+            self.portfolio = load_portfolio(portfolio_file)
         self.cache_dir = "data_cache"
         os.makedirs(self.cache_dir, exist_ok=True)
+        self._session = self._create_session()
+        self._newsapi_blocked = threading.Event()
+        # Stock data already fetched in this run, keyed by timeframe
+        self._stock_data = {}
+        # One shared set of Ticker objects and session lets yfinance reuse its
+        # cookie/crumb handshake and connections across calls
+        self._tickers = yf.Tickers(" ".join(f"{symbol}.NS" for symbol in self.portfolio["stocks"]),
+                                   session=self._session)
     
-    def _load_portfolio(self, file_path):
-        """Load portfolio from JSON file"""
-        with open(file_path, 'r') as f:
-            return json.load(f)
-        
+    def _create_session(self):
+        """Create an HTTP session that keeps connections alive between requests"""
+        session = requests.Session()
+        # Transient failures are retried with backoff, honouring any Retry-After header
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                        respect_retry_after_header=True, raise_on_status=False)
+        session.mount("https://", HTTPAdapter(pool_connections=MAX_FETCH_WORKERS,
+                                              pool_maxsize=MAX_FETCH_WORKERS, max_retries=retries))
+        # A NewsAPI 429 means the quota is spent, so retrying only burns time;
+        # it is handled by skipping the remaining NewsAPI requests instead. Retry
+        # honours Retry-After on a 429 even outside status_forcelist, so turn that off.
+        newsapi_retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                                respect_retry_after_header=False, raise_on_status=False)
+        session.mount("https://newsapi.org/", HTTPAdapter(pool_connections=MAX_FETCH_WORKERS,
+                                                          pool_maxsize=MAX_FETCH_WORKERS,
+                                                          max_retries=newsapi_retries))
+        return session
+    
+    def _cache_load(self, key):
+        """Return the cache entry ({"ts", "val"}) for key regardless of age, or None"""
+        path = os.path.join(self.cache_dir, hashlib.md5(key.encode()).hexdigest() + ".pkl")
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _cache_get(self, key, ttl=float("inf"), since=None):
+        """
+        Return the cached value for key if it is younger than ttl seconds and,
+        when since is given, was written at or after that timestamp
+        """
+        entry = self._cache_load(key)
+        if entry is None or not self._is_fresh(entry, ttl, since):
+            return None
+        return entry["val"]
+
+    @staticmethod
+    def _is_fresh(entry, ttl=float("inf"), since=None):
+        """Whether a cache entry is within ttl seconds and not older than since"""
+        if since is not None and entry["ts"] < since:
+            return False
+        return time.time() - entry["ts"] <= ttl
+
+    def _cache_put(self, key, value):
+        """Store value in the on-disk cache under key"""
+        path = os.path.join(self.cache_dir, hashlib.md5(key.encode()).hexdigest() + ".pkl")
+        try:
+            atomic_write(path, pickle.dumps({"ts": time.time(), "val": value}))
+        except OSError as e:
+            print(f"DataCollector | [Cache] Error writing {key}: {e}")
+
+    def _ticker(self, ticker_symbol):
+        """Return the shared Ticker for a symbol, creating one if it is not in the portfolio"""
+        ticker = self._tickers.tickers.get(ticker_symbol)
+        if ticker is None:
+            ticker = yf.Ticker(ticker_symbol, session=self._session)
+        return ticker
+
     def fetch_nifty_data(self, timeframe="1mo"):
         """
         Fetch Nifty 50 index data
@@ -32,47 +151,187 @@ class DataCollector:
         print("DataCollector | Fetching Nifty data...")
         nifty_symbol = "^NSEI"
         try:
-            nifty_data = yf.Ticker(nifty_symbol)
+            nifty_data = self._ticker(nifty_symbol)
             hist = nifty_data.history(period=timeframe)
             cache_path = os.path.join(self.cache_dir, "nifty_data.csv")
-            hist.to_csv(cache_path)
+            hist.to_csv(cache_path, float_format=CSV_FLOAT_FORMAT)
             print("DataCollector | Successfully fetched Nifty data")
             return hist
         except Exception as e:
             print(f"DataCollector | Error fetching Nifty data: {e}")
             return None
     
-    def fetch_stock_data(self, timeframe="1mo"):
+    def fetch_stock_data(self, timeframe="1mo", force_refresh=False):
         """
         Fetch historical stock data for all portfolio stocks
         timeframe: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, max
+        force_refresh: Ignore cached history and download the full timeframe again
         """
+        if timeframe in self._stock_data and not force_refresh:
+            return self._stock_data[timeframe]
+
         print("DataCollector | Fetching stock data...")
         stock_data = {}
+        ttl = INTRADAY_HISTORY_TTL if timeframe in ("1d", "5d") else float("inf")
+        last_close = _last_market_close()
+        symbols = []
+        stale = {}
         for symbol in self.portfolio["stocks"]:
-            # For Indian stocks, append .NS for NSE listings
-            ticker_symbol = f"{symbol}.NS"
-            try:
-                # Get data from Yahoo Finance
-                ticker_data = yf.Ticker(ticker_symbol)
-                hist = ticker_data.history(period=timeframe)
-                stock_data[symbol] = hist
-                
-                # Cache the data
-                cache_path = os.path.join(self.cache_dir, f"{symbol}_data.csv")
-                hist.to_csv(cache_path)
-                
-                print(f"DataCollector | Successfully fetched data for {symbol}")
-            except Exception as e:
-                print(f"DataCollector | Error fetching data for {symbol}: {e}")
+            entry = None if force_refresh else self._cache_load(f"hist:{symbol}:{timeframe}")
+            if entry is not None and self._is_fresh(entry, ttl, last_close):
+                stock_data[symbol] = entry["val"]
+                print(f"DataCollector | Using cached data for {symbol}")
+            else:
+                if entry is not None and timeframe in HISTORY_WINDOWS:
+                    stale[symbol] = entry["val"]
+                symbols.append(symbol)
+
+        # Expired histories only need the bars added since they were cached
+        if stale:
+            stock_data.update(self._update_histories(stale, timeframe))
+            symbols = [symbol for symbol in symbols if symbol not in stock_data]
+        if not symbols:
+            self._stock_data[timeframe] = stock_data
+            return stock_data
+
+        # A single batched download covers every symbol instead of one request each
+        # For Indian stocks, append .NS for NSE listings
+        tickers = " ".join(f"{symbol}.NS" for symbol in symbols)
+        try:
+            batch = yf.download(tickers, period=timeframe, group_by="ticker", threads=True,
+                                progress=False, ignore_tz=False, session=self._session)
+        except Exception as e:
+            print(f"DataCollector | Error fetching batch stock data: {e}")
+            batch = None
+
+        missing = []
+        for symbol in symbols:
+            hist = self._extract_history(batch, symbol)
+            if hist is None:
+                missing.append(symbol)
+                continue
+            stock_data[symbol] = hist
+            self._store_history(symbol, timeframe, hist)
+            print(f"DataCollector | Successfully fetched data for {symbol}")
+
+        # Fall back to individual requests for anything the batch did not return
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(missing))) as executor:
+                for symbol, hist in executor.map(lambda s: self._fetch_history(s, timeframe), missing):
+                    if hist is not None:
+                        stock_data[symbol] = hist
         
+        self._stock_data[timeframe] = stock_data
         return stock_data
+
+    def _update_histories(self, stale, timeframe):
+        """
+        Extend cached histories with the bars since their last cached date and
+        drop bars that have fallen out of the timeframe
+        stale: {symbol: cached history}
+        Returns the updated histories; symbols missing from the result need a full fetch.
+        Prices are split/dividend adjusted, so a symbol whose adjustment basis moved
+        since it was cached is left out rather than spliced onto stale bars.
+        """
+        # Start from the oldest reference bar (see _reference_date); the bars after it
+        # are refetched, including a last bar that may have been cached mid-session
+        start = min(self._reference_date(hist) for hist in stale.values())
+        tickers = " ".join(f"{symbol}.NS" for symbol in stale)
+        try:
+            batch = yf.download(tickers, start=start.strftime("%Y-%m-%d"), group_by="ticker", threads=True,
+                                actions=True, progress=False, ignore_tz=False, session=self._session)
+        except Exception as e:
+            print(f"DataCollector | Error updating stock data: {e}")
+            return {}
+
+        updated = {}
+        for symbol, cached in stale.items():
+            tail = self._extract_history(batch, symbol)
+            if tail is None:
+                continue
+            if self._adjustment_changed(cached, tail):
+                print(f"DataCollector | Price adjustments changed for {symbol}, refetching full history")
+                continue
+            tail = tail.reindex(columns=cached.columns)
+            hist = pd.concat([cached[cached.index < tail.index[0]], tail])
+            cutoff = pd.Timestamp.now(tz=hist.index.tz).normalize() - HISTORY_WINDOWS[timeframe]
+            hist = hist[hist.index >= cutoff]
+            updated[symbol] = hist
+            self._store_history(symbol, timeframe, hist)
+            print(f"DataCollector | Updated data for {symbol} with {len(tail)} recent rows")
+        return updated
+
+    def _reference_date(self, cached):
+        """
+        Last cached bar known to be complete: the one before the last, since the
+        last may have been cached mid-session
+        """
+        return cached.index[-2] if len(cached) > 1 else cached.index[-1]
+
+    def _adjustment_changed(self, cached, tail):
+        """
+        Check whether freshly downloaded bars are on a different adjustment basis
+        than the cached history: the re-downloaded reference bar no longer has
+        the cached close, or a split or dividend happened in the new bars
+        """
+        reference_date = self._reference_date(cached)
+        if reference_date not in tail.index:
+            return True
+        cached_close = cached.at[reference_date, "Close"]
+        new_close = tail.at[reference_date, "Close"]
+        if pd.isna(new_close) or abs(new_close / cached_close - 1) > ADJUSTMENT_TOLERANCE:
+            return True
+        new_bars = tail[tail.index > reference_date]
+        for column in ("Dividends", "Stock Splits"):
+            if column in new_bars.columns and new_bars[column].fillna(0).ne(0).any():
+                return True
+        return False
+
+    def clear_run_cache(self):
+        """Forget stock data fetched earlier so the next run sees fresh prices"""
+        self._stock_data.clear()
+
+    def _store_history(self, symbol, timeframe, hist):
+        """Cache freshly fetched history, with a CSV copy for inspection"""
+        self._cache_put(f"hist:{symbol}:{timeframe}", hist)
+        cache_path = os.path.join(self.cache_dir, f"{symbol}_data.csv")
+        hist.to_csv(cache_path, float_format=CSV_FLOAT_FORMAT)
+
+    def _extract_history(self, batch, symbol):
+        """Slice a single stock's history out of a batched download"""
+        ticker_symbol = f"{symbol}.NS"
+        if batch is None or ticker_symbol not in batch.columns.get_level_values(0):
+            return None
+        hist = batch[ticker_symbol].dropna(how="all")
+        return hist if not hist.empty else None
+
+    def _fetch_history(self, symbol, timeframe):
+        """Fetch and cache price history for a single stock"""
+        # For Indian stocks, append .NS for NSE listings
+        ticker_symbol = f"{symbol}.NS"
+        try:
+            # Get data from Yahoo Finance
+            ticker_data = self._ticker(ticker_symbol)
+            hist = ticker_data.history(period=timeframe)
+            if hist.empty:
+                raise ValueError("no price data returned")
+            self._store_history(symbol, timeframe, hist)
+            
+            print(f"DataCollector | Successfully fetched data for {symbol}")
+            return symbol, hist
+        except Exception as e:
+            print(f"DataCollector | Error fetching data for {symbol}: {e}")
+            return symbol, None
     
     def fetch_financial_metrics(self, symbol):
         """Fetch key financial metrics for a stock"""
+        cached = self._cache_get(f"metrics:{symbol}", since=_last_market_close())
+        if cached is not None:
+            return cached
+
         print(f"DataCollector | Fetching financial metrics for {symbol}...")
         ticker_symbol = f"{symbol}.NS"
-        ticker = yf.Ticker(ticker_symbol)
+        ticker = self._ticker(ticker_symbol)
         
         # Get financial info
         info = ticker.info
@@ -87,8 +346,27 @@ class DataCollector:
             "Return on Equity": info.get("returnOnEquity", None),
             "Debt to Equity": info.get("debtToEquity", None)
         }
+        self._cache_put(f"metrics:{symbol}", metrics)
         
         return metrics
+
+    def fetch_financial_metrics_batch(self, symbols):
+        """Fetch financial metrics for several stocks, returned as {symbol: metrics}"""
+        metrics_map = {}
+        missing = []
+        last_close = _last_market_close()
+        for symbol in symbols:
+            cached = self._cache_get(f"metrics:{symbol}", since=last_close)
+            if cached is not None:
+                metrics_map[symbol] = cached
+            else:
+                missing.append(symbol)
+        
+        # Each lookup is its own request, so run the uncached ones concurrently
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(missing))) as executor:
+                metrics_map.update(zip(missing, executor.map(self.fetch_financial_metrics, missing)))
+        return {symbol: metrics_map[symbol] for symbol in symbols}
     
 
     def fetch_news(self, symbols=None, days=3, source="rss"):
@@ -105,123 +383,178 @@ class DataCollector:
             symbols = self.portfolio["stocks"]
 
         source = source.lower()
+        cache_key = f"news:{source}:{days}:{','.join(symbols)}"
+        cached = self._cache_get(cache_key, NEWS_TTL)
+        if cached is not None:
+            print("DataCollector | Using cached news")
+            return cached
+
         if source == "newsapi":
-            return self._fetch_newsapi_news(symbols, days)
+            news = self._fetch_newsapi_news(symbols, days)
         elif source == "rss":
-            return self._fetch_rss_news(symbols, days)
+            news = self._fetch_rss_news(symbols, days)
         else:
             raise ValueError("DataCollector | Invalid news source. Choose 'rss' or 'newsapi'.")
 
+        if news:
+            self._cache_put(cache_key, news)
+        return news
+
     def _fetch_newsapi_news(self, symbols, days):
         print("DataCollector | Fetching news from NewsAPI...")
         news_api_key = os.getenv("NEWS_API_KEY")
+        self._newsapi_blocked.clear()
 
         all_news = []
         from_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
+        # (tag, query, article limit) for each request; tag is the symbol or MARKET
+        jobs = []
         for symbol in symbols:
             company_name = self.portfolio.get("company_names", {}).get(symbol, symbol)
-            url = (
-                f"https://newsapi.org/v2/everything?q={company_name}"
-                f"&from={from_date}&sortBy=publishedAt&apiKey={news_api_key}&language=en"
-            )
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    for article in response.json().get("articles", []):
-                        all_news.append({
-                            "symbol": symbol,
-                            "title": article.get("title"),
-                            "source": article.get("source", {}).get("name"),
-                            "published_at": article.get("publishedAt"),
-                            "url": article.get("url"),
-                            "summary": article.get("description"),
-                        })
-                else:
-                    print(f"DataCollector | [NewsAPI] Error for {symbol}: {response.status_code}")
-            except Exception as e:
-                print(f"DataCollector | [NewsAPI] Exception for {symbol}: {e}")
+            jobs.append((symbol, company_name, None))
 
         # General market news
         market_terms = ["NSE", "Sensex", "Nifty", "Indian stock market"]
         for term in market_terms:
+            jobs.append(("MARKET", term, 5))
+
+        def fetch(job):
+            tag, query, limit = job
             url = (
-                f"https://newsapi.org/v2/everything?q={term}"
+                f"https://newsapi.org/v2/everything?q={query}"
                 f"&from={from_date}&sortBy=publishedAt&apiKey={news_api_key}&language=en"
             )
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    for article in response.json().get("articles", [])[:5]:
-                        all_news.append({
-                            "symbol": "MARKET",
-                            "title": article.get("title"),
-                            "source": article.get("source", {}).get("name"),
-                            "published_at": article.get("publishedAt"),
-                            "url": article.get("url"),
-                            "summary": article.get("description"),
-                        })
-            except Exception as e:
-                print(f"DataCollector | [NewsAPI] Exception for market term '{term}': {e}")
+            label = f"market term '{query}'" if tag == "MARKET" else tag
+            return tag, self._fetch_newsapi_articles(url, label)[:limit]
+
+        # Requests are independent, so overlap their network waits
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(jobs))) as executor:
+            for tag, articles in executor.map(fetch, jobs):
+                for article in articles:
+                    all_news.append({
+                        "symbol": tag,
+                        "title": article.get("title"),
+                        "source": article.get("source", {}).get("name"),
+                        "published_at": article.get("publishedAt"),
+                        "url": article.get("url"),
+                        "summary": article.get("description"),
+                    })
 
         return self._finalize_news(all_news)
 
+    def _fetch_newsapi_articles(self, url, label):
+        """Fetch the articles for a single NewsAPI query"""
+        if self._newsapi_blocked.is_set():
+            return []
+        try:
+            response = self._session.get(url, timeout=10)
+            if response.status_code == 200:
+                return response.json().get("articles", [])
+            if response.status_code == 429:
+                if not self._newsapi_blocked.is_set():
+                    self._newsapi_blocked.set()
+                    print("DataCollector | [NewsAPI] Rate limited, skipping remaining requests")
+                return []
+            print(f"DataCollector | [NewsAPI] Error for {label}: {response.status_code}")
+        except Exception as e:
+            print(f"DataCollector | [NewsAPI] Exception for {label}: {e}")
+        return []
+
     def _fetch_rss_news(self, symbols, days):
         print("DataCollector | Fetching news from RSS...")
         all_news = []
-        cutoff_date = datetime.now() - timedelta(days=days)
+        # feedparser normalizes published dates to UTC time tuples, so compare
+        # tuples directly and only build datetimes for entries that are kept
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = cutoff_date.timetuple()[:6]
 
+        # (tag, query, entry limit) for each feed; tag is the symbol or MARKET
+        jobs = []
         for symbol in symbols:
             company_name = self.portfolio.get("company_names", {}).get(symbol, symbol)
-            query = company_name.replace(" ", "+")
-            rss_url = f"https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
-            try:
-                feed = feedparser.parse(rss_url)
-                for entry in feed.entries:
-                    published_at = datetime(*entry.published_parsed[:6])
-                    if published_at >= cutoff_date:
-                        all_news.append({
-                            "symbol": symbol,
-                            "title": entry.title,
-                            "source": entry.get("source", {}).get("title", "Google News"),
-                            "published_at": published_at.isoformat(),
-                            "url": entry.link,
-                            "summary": entry.get("summary", ""),
-                        })
-            except Exception as e:
-                print(f"DataCollector | [RSS] Error fetching news for {symbol}: {e}")
+            jobs.append((symbol, company_name, None))
 
         # General market news
         market_terms = ["NSE", "Sensex", "Nifty", "Indian stock market"]
         for term in market_terms:
-            query = term.replace(" ", "+")
-            rss_url = f"https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
+            jobs.append(("MARKET", term, 5))
+
+        def label(tag, query):
+            return f"market news for {query}" if tag == "MARKET" else f"news for {tag}"
+
+        def fetch(job):
+            tag, query, limit = job
+            rss_url = f"https://news.google.com/rss/search?q={query.replace(' ', '+')}&hl=en-IN&gl=IN&ceid=IN:en"
+            try:
+                return job, self._fetch_rss_entries(rss_url)
+            except Exception as e:
+                print(f"DataCollector | [RSS] Error fetching {label(tag, query)}: {e}")
+                return job, None
+
+        # Feed downloads are independent, so overlap their network waits
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(jobs))) as executor:
+            feeds = list(executor.map(fetch, jobs))
+
+        for (tag, query, limit), entries in feeds:
+            if entries is None:
+                continue
             try:
-                feed = feedparser.parse(rss_url)
-                for entry in feed.entries[:5]:
-                    published_at = datetime(*entry.published_parsed[:6])
-                    if published_at >= cutoff_date:
+                for entry in entries[:limit]:
+                    published = entry["published_parsed"][:6]
+                    if published >= cutoff:
+                        published_at = datetime(*published)
                         all_news.append({
-                            "symbol": "MARKET",
-                            "title": entry.title,
-                            "source": entry.get("source", {}).get("title", "Google News"),
+                            "symbol": tag,
+                            "title": entry["title"],
+                            "source": entry["source"],
                             "published_at": published_at.isoformat(),
-                            "url": entry.link,
-                            "summary": entry.get("summary", ""),
+                            "url": entry["url"],
+                            "summary": entry["summary"],
                         })
             except Exception as e:
-                print(f"DataCollector | [RSS] Error fetching market news for {term}: {e}")
+                print(f"DataCollector | [RSS] Error fetching {label(tag, query)}: {e}")
 
         return self._finalize_news(all_news)
 
+    def _fetch_rss_entries(self, rss_url):
+        """
+        Fetch the entries of an RSS feed, using a conditional GET so an
+        unchanged feed is served from the cache instead of re-downloaded
+        """
+        cache_key = f"rss:{rss_url}"
+        cached = self._cache_get(cache_key, float("inf")) or {}
+        feed = feedparser.parse(rss_url, etag=cached.get("etag"), modified=cached.get("modified"))
+        if feed.get("status") == 304 and "entries" in cached:
+            return cached["entries"]
+
+        entries = [{
+            "title": entry.title,
+            "source": entry.get("source", {}).get("title", "Google News"),
+            "published_parsed": tuple(entry.published_parsed),
+            "url": entry.link,
+            "summary": entry.get("summary", ""),
+        } for entry in feed.entries]
+
+        if feed.get("etag") or feed.get("modified"):
+            self._cache_put(cache_key, {
+                "etag": feed.get("etag"),
+                "modified": feed.get("modified"),
+                "entries": entries,
+            })
+        return entries
+
     def _finalize_news(self, all_news):
         print("DataCollector | Finalizing news data...")
-        all_news.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
         try:
             os.makedirs(self.cache_dir, exist_ok=True)
-            with open(os.path.join(self.cache_dir, "latest_news.json"), "w", encoding="utf-8") as f:
-                json.dump(all_news, f, indent=2)
+            # Newest first in the file only; callers pick the items they need with
+            # heapq (see NewsAggregator.summarize_news), so the returned list stays
+            # unsorted. published_at may be present but None (e.g. from NewsAPI)
+            newest_first = sorted(all_news, key=lambda x: x.get("published_at") or "", reverse=True)
+            # Machine-read cache, so skip pretty-printing
+            atomic_write(os.path.join(self.cache_dir, "latest_news.json"),
+                         dumps_json(newest_first, separators=(",", ":")))
         except Exception as e:
             print(f"DataCollector | [Cache] Error writing news to cache: {e}")
 
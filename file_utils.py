@@ -0,0 +1,39 @@
+import json
+import os
+import threading
+
+def atomic_write(path, data, fsync=False):
+    """
+    Write a file in one call and atomically replace the destination, so a
+    crash mid-write never leaves a truncated file behind
+    path: Destination file path
+    data: str (written as UTF-8) or bytes
+    fsync: Flush the data to disk before the rename, so the new file survives a crash
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    # Unique per writer so concurrent writes to the same path don't collide
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _json_default(obj):
+    """Coerce the NumPy/pandas values analysis results carry into JSON types"""
+    if hasattr(obj, "isoformat"):  # datetime, date, pd.Timestamp
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):  # NumPy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj, **kwargs):
+    """json.dumps that also accepts NumPy scalars/arrays and timestamps"""
+    return json.dumps(obj, default=_json_default, **kwargs)
@@ -1,43 +1,134 @@
 import json
 import os
+import time
+import hashlib
+import sqlite3
 import requests
 from datetime import datetime
 from dotenv import load_dotenv
+from file_utils import atomic_write
 
 load_dotenv()
 
+# Seconds a decision report may be reused for an identical prompt
+DECISION_CACHE_TTL = 24 * 60 * 60
+
+class _OllamaError(Exception):
+    """Ollama answered, but with an error instead of generated text"""
+
 class LLMConnector:
-    def __init__(self, endpoint=None):
+    def __init__(self, endpoint=None, cache_path=os.path.join("portfolio_ai", "llm_cache.sqlite")):
         """
         Initialize the LLM connector for Ollama
         endpoint: API endpoint for Ollama
+        cache_path: SQLite file used to cache responses by prompt
         """
         self.endpoint = endpoint or os.getenv("OLLAMA_API_ENDPOINT")
         self.model = "llama3"  # or any other model you have in Ollama
+        # Shared session so concurrent generations reuse pooled keep-alive connections
+        self._session = requests.Session()
+        # (connect, read) seconds; responses are read as a stream, so the read
+        # timeout bounds the wait for each chunk, not the whole generation
+        self.timeout = (10, 300)
+        self.cache_path = cache_path
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        conn = self._connect_cache()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, response TEXT)")
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _connect_cache(self):
+        """Open a connection to the response cache (one per call, so threads never share one)"""
+        return sqlite3.connect(self.cache_path, timeout=10)
+    
+    def _cache_key(self, prompt, max_tokens):
+        """Hash everything that determines the response into a cache key"""
+        return hashlib.sha256(f"{self.model}\0{max_tokens}\0{prompt}".encode("utf-8")).hexdigest()
+    
+    def _cached_response(self, key, ttl):
+        """Return the cached response for key if it is younger than ttl seconds"""
+        conn = self._connect_cache()
+        try:
+            row = conn.execute("SELECT created, response FROM responses WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        return row[1]
     
-    def generate_content(self, prompt, max_tokens=2000):
+    def _cache_response(self, key, response):
+        """Store a generated response under key"""
+        conn = self._connect_cache()
+        try:
+            conn.execute("INSERT OR REPLACE INTO responses (key, created, response) VALUES (?, ?, ?)",
+                         (key, time.time(), response))
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def generate_content(self, prompt, max_tokens=2000, cache_ttl=None):
         """
         Generate content using local LLM via Ollama
         prompt: The prompt to send to the LLM
         max_tokens: Maximum number of tokens to generate
+        cache_ttl: Seconds an identical prompt may be answered from the cache
+                   (None disables caching)
         """
+        cache_key = None
+        if cache_ttl:
+            cache_key = self._cache_key(prompt, max_tokens)
+            cached = self._cached_response(cache_key, cache_ttl)
+            if cached is not None:
+                print(f"LLMConnector | Using cached response for prompt: {prompt[:50]}...")
+                return cached
+        
         print(f"LLMConnector | Generating content with prompt: {prompt[:50]}...")
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            # Always streamed: a long generation on a slow machine keeps sending
+            # chunks instead of going silent until the read timeout fires
+            "stream": True,
             "max_tokens": max_tokens
         }
         
         try:
-            response = requests.post(self.endpoint, json=payload)
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "LLMConnector | Error: No response found")
-            else:
-                return f"LLMConnector | Error: {response.status_code} - {response.text}"
+            text = "".join(self._stream_chunks(payload))
+        except _OllamaError as e:
+            return f"LLMConnector | Error: {e}"
         except Exception as e:
             return f"LLMConnector | Exception when calling Ollama API: {str(e)}"
+        # Only successful generations are cached, never error messages
+        if cache_key is not None:
+            self._cache_response(cache_key, text)
+        return text
+
+    def _stream_chunks(self, payload):
+        """
+        Yield response text from Ollama's newline-delimited JSON stream
+        Raises _OllamaError for an error status or error chunk, and if no chunk
+        carried a response
+        """
+        with self._session.post(self.endpoint, json=payload, stream=True, timeout=self.timeout) as response:
+            if response.status_code != 200:
+                raise _OllamaError(f"{response.status_code} - {response.text}")
+            has_response = False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise _OllamaError(chunk["error"])
+                if "response" in chunk:
+                    has_response = True
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+            if not has_response:
+                raise _OllamaError("No response found")
 
 class DecisionEngine:
     def __init__(self, portfolio_analyzer, news_aggregator, llm_connector):
@@ -110,12 +201,11 @@ class DecisionEngine:
             news_summary=news_summary
         )
         
-        # Get decision report from LLM
-        decision_report = self.llm.generate_content(prompt)
+        # Get decision report from LLM; a rerun on the same data reuses the answer
+        decision_report = self.llm.generate_content(prompt, cache_ttl=DECISION_CACHE_TTL)
         
         # Save decision report
         today = datetime.now().strftime("%Y-%m-%d")
-        with open(os.path.join(self.decisions_dir, f"portfolio_decisions_{today}.md"), "w", encoding="utf-8") as f:
-            f.write(decision_report)
+        atomic_write(os.path.join(self.decisions_dir, f"portfolio_decisions_{today}.md"), decision_report)
         
         return decision_report
@@ -1,4 +1,5 @@
 import argparse
+import logging
 from portfolio_ai_workflow import PortfolioAIWorkflow
 
 def main():
@@ -12,6 +13,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Plain messages, matching the components that still print directly
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Initialize workflow
     workflow = PortfolioAIWorkflow(portfolio_file=args.portfolio)
     
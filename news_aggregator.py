@@ -1,7 +1,24 @@
-import json
 import os
+import re
+import heapq
 from datetime import datetime
 import pandas as pd
+from file_utils import atomic_write, dumps_json
+
+HIGH_IMPACT_KEYWORDS = ["plunge", "surge", "crash", "soar", "record high", "record low",
+                        "major announcement", "acquisition", "merger", "scandal", "regulatory"]
+MEDIUM_IMPACT_KEYWORDS = ["earnings", "results", "guidance", "outlook", "forecast",
+                          "expansion", "partnership", "new product", "dividend"]
+
+# Number of most recent items per category included in the summary prompt
+SUMMARY_ITEMS_PER_CATEGORY = 5
+
+# Seconds a news summary may be reused for the same set of headlines
+SUMMARY_CACHE_TTL = 6 * 60 * 60
+
+def _published_key(item):
+    """Sort key for news items; ISO timestamps order correctly as strings"""
+    return item.get("published_at") or ""
 
 class NewsAggregator:
     def __init__(self, data_collector, llm_connector):
@@ -14,6 +31,10 @@ class NewsAggregator:
         self.llm = llm_connector
         self.news_dir = "news_reports"
         os.makedirs(self.news_dir, exist_ok=True)
+        
+        # Compile each keyword list into one pattern so a text is scanned once per category
+        self._high_impact_pattern = re.compile("|".join(map(re.escape, HIGH_IMPACT_KEYWORDS)))
+        self._medium_impact_pattern = re.compile("|".join(map(re.escape, MEDIUM_IMPACT_KEYWORDS)))
     
     def fetch_and_categorize_news(self, news_items=None, days=3):
         """
@@ -24,7 +45,7 @@ class NewsAggregator:
         if news_items is None:
             news_items = self.data_collector.fetch_news(days=days)
             
-        portfolio_symbols = self.data_collector.portfolio["stocks"]
+        portfolio_symbols = frozenset(self.data_collector.portfolio["stocks"])
         
         # Categorize news
         categorized_news = {
@@ -34,46 +55,52 @@ class NewsAggregator:
             "general_market": []
         }
         
+        # Bind the per-item operations once, outside the loop
+        add_high = categorized_news["high_impact"].append
+        add_medium = categorized_news["medium_impact"].append
+        add_low = categorized_news["low_impact"].append
+        add_market = categorized_news["general_market"].append
+        is_high_impact = self._high_impact_pattern.search
+        is_medium_impact = self._medium_impact_pattern.search
+        
         for item in news_items:
-            if item["symbol"] == "MARKET":
-                categorized_news["general_market"].append(item)
-            elif item["symbol"] in portfolio_symbols:
+            symbol = item["symbol"]
+            if symbol == "MARKET":
+                add_market(item)
+            elif symbol in portfolio_symbols:
                 # This would be better with LLM assistance to categorize impact
                 # For now, use a simple keyword-based approach
-                title_lower = item["title"].lower()
-                summary_lower = item["summary"].lower() if item["summary"] else ""
-                
-                high_impact_keywords = ["plunge", "surge", "crash", "soar", "record high", "record low",
-                                       "major announcement", "acquisition", "merger", "scandal", "regulatory"]
-                medium_impact_keywords = ["earnings", "results", "guidance", "outlook", "forecast", 
-                                         "expansion", "partnership", "new product", "dividend"]
+                # Newline separator keeps a keyword from matching across title and summary
+                text = f"{item['title'] or ''}\n{item['summary'] or ''}".lower()
                 
-                if any(keyword in title_lower or keyword in summary_lower for keyword in high_impact_keywords):
-                    categorized_news["high_impact"].append(item)
-                elif any(keyword in title_lower or keyword in summary_lower for keyword in medium_impact_keywords):
-                    categorized_news["medium_impact"].append(item)
+                if is_high_impact(text):
+                    add_high(item)
+                elif is_medium_impact(text):
+                    add_medium(item)
                 else:
-                    categorized_news["low_impact"].append(item)
+                    add_low(item)
         
         # Save categorized news
-        with open(os.path.join(self.news_dir, "categorized_news.json"), "w", encoding="utf-8") as f:
-            json.dump(categorized_news, f, indent=2)
+        atomic_write(os.path.join(self.news_dir, "categorized_news.json"),
+                     dumps_json(categorized_news, separators=(",", ":")))
         
         return categorized_news
     
-    def summarize_news(self, categorized_news=None):
+    def summarize_news(self, categorized_news=None, news_items=None):
         """
         Summarize news using LLM
-        categorized_news: Pre-categorized news dict (if None, will fetch new)
+        categorized_news: Pre-categorized news dict (if None, will categorize news_items)
+        news_items: Already fetched news to categorize (if None, will fetch new)
         """
         print("NewsAggregator | Summarizing news...")
         if categorized_news is None:
-            categorized_news = self.fetch_and_categorize_news()
+            categorized_news = self.fetch_and_categorize_news(news_items=news_items)
         
-        # Prepare news for summarization
-        high_impact_news = categorized_news["high_impact"]
-        medium_impact_news = categorized_news["medium_impact"]
-        market_news = categorized_news["general_market"]
+        # Prepare news for summarization, keeping only the most recent items
+        k = SUMMARY_ITEMS_PER_CATEGORY
+        high_impact_news = heapq.nlargest(k, categorized_news["high_impact"], key=_published_key)
+        medium_impact_news = heapq.nlargest(k, categorized_news["medium_impact"], key=_published_key)
+        market_news = heapq.nlargest(k, categorized_news["general_market"], key=_published_key)
         
         # Prepare prompt for LLM
         prompt_template = """
@@ -96,9 +123,9 @@ class NewsAggregator:
         """
         
         # Format news for prompt
-        formatted_high_impact = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in high_impact_news[:5]])
-        formatted_medium_impact = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in medium_impact_news[:5]])
-        formatted_market = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in market_news[:5]])
+        formatted_high_impact = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in high_impact_news])
+        formatted_medium_impact = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in medium_impact_news])
+        formatted_market = "\n".join([f"- {item['title']} (Source: {item['source']})" for item in market_news])
         
         prompt = prompt_template.format(
             high_impact_news=formatted_high_impact if formatted_high_impact else "None",
@@ -107,11 +134,10 @@ class NewsAggregator:
         )
         
         # Get summary from LLM
-        summary = self.llm.generate_content(prompt)
+        summary = self.llm.generate_content(prompt, cache_ttl=SUMMARY_CACHE_TTL)
         
         # Save summary
         today = datetime.now().strftime("%Y-%m-%d")
-        with open(os.path.join(self.news_dir, f"news_summary_{today}.md"), "w", encoding="utf-8") as f:
-            f.write(summary)
+        atomic_write(os.path.join(self.news_dir, f"news_summary_{today}.md"), summary)
         
         return summary
@@ -2,8 +2,9 @@ import os
 import json
 import schedule
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from data_collector import DataCollector
+from data_collector import DataCollector, load_portfolio
 from llm_connector import LLMConnector, DecisionEngine
 from portfolio_analyzer import PortfolioAnalyzer
 from news_aggregator import NewsAggregator
@@ -16,8 +17,9 @@ class PortfolioAIWorkflow:
         self.base_dir = "portfolio_ai"
         os.makedirs(self.base_dir, exist_ok=True)
         
-        # Initialize components
-        self.data_collector = DataCollector(portfolio_file)
+        # Initialize components; the portfolio is parsed once and shared
+        self.portfolio = load_portfolio(portfolio_file)
+        self.data_collector = DataCollector(self.portfolio)
         self.llm = LLMConnector()
         self.portfolio_analyzer = PortfolioAnalyzer(self.data_collector)
         self.news_aggregator = NewsAggregator(self.data_collector, self.llm)
@@ -27,6 +29,7 @@ class PortfolioAIWorkflow:
         # Status tracking
         self.last_run = None
         self.run_history = []
+        self.max_history = 100
     
     def run_daily_workflow(self):
         """Run the complete daily workflow"""
@@ -36,36 +39,44 @@ class PortfolioAIWorkflow:
         try:
             # 1. Collect data
             print("1 - Collecting data...")
-            print("1.1 - Collecting stock data...")
-            stock_data = self.data_collector.fetch_stock_data("1y")
-            print("1.1 - Collected stock data successfully")
-            print("1.2 - Collecting news...")
-            news = self.data_collector.fetch_news(days=3)
-            print("1.2 - Collected news successfully")
+            self.data_collector.clear_run_cache()
+            # Stock data and news come from independent services, so fetch both at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                print("1.1 - Collecting stock data...")
+                stock_future = executor.submit(self.data_collector.fetch_stock_data, "1y")
+                print("1.2 - Collecting news...")
+                news_future = executor.submit(self.data_collector.fetch_news, days=3)
+                stock_data = stock_future.result()
+                print("1.1 - Collected stock data successfully")
+                news = news_future.result()
+                print("1.2 - Collected news successfully")
             print("1 - Data collection completed successfully")
             
-            # 2. Run portfolio analysis
-            print("2 - Running portfolio analysis...")
-            print("2.1 - Analyzing portfolio...")
-            performance = self.portfolio_analyzer.calculate_portfolio_performance(stock_data=stock_data)
-            print("2.1 - Portfolio performance calculated successfully")
-            print("2.2 - Analyzing stock contributions...")
-            contributions = self.portfolio_analyzer.analyze_stock_contributions(stock_data=stock_data)
-            print("2.2 Stock contributions analyzed successfully")
-            print("2.3 - Generating optimization suggestions...")
-            suggestions = self.portfolio_analyzer.generate_optimization_suggestions(performance, contributions, stock_data=stock_data)
-            print("2.3 Optimization suggestions generated successfully")
-            print("2 - Portfolio analysis completed successfully")
+            # News processing waits mostly on the LLM and the contribution analysis on
+            # financial metric requests; neither depends on the other or on the
+            # performance calculation, so run all three side by side
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                news_future = executor.submit(self._process_news, news)
 
-            # 3. Process news
-            print("3 - Processing news...")
-            print("3.1 - Processing news...")
-            categorized_news = self.news_aggregator.fetch_and_categorize_news(news_items=news)
-            print("3.1 - News categorized successfully")
-            print("3.2 - Summarizing news...")
-            news_summary = self.news_aggregator.summarize_news(categorized_news)
-            print("3.2 - News summarized successfully")
-            print("3 - News processing completed successfully")
+                # 2. Run portfolio analysis
+                print("2 - Running portfolio analysis...")
+                print("2.1 - Analyzing portfolio...")
+                performance_future = executor.submit(self.portfolio_analyzer.calculate_portfolio_performance,
+                                                     stock_data=stock_data)
+                print("2.2 - Analyzing stock contributions...")
+                contributions_future = executor.submit(self.portfolio_analyzer.analyze_stock_contributions,
+                                                       stock_data=stock_data)
+                performance = performance_future.result()
+                print("2.1 - Portfolio performance calculated successfully")
+                contributions = contributions_future.result()
+                print("2.2 Stock contributions analyzed successfully")
+                print("2.3 - Generating optimization suggestions...")
+                suggestions = self.portfolio_analyzer.generate_optimization_suggestions(performance, contributions, stock_data=stock_data)
+                print("2.3 Optimization suggestions generated successfully")
+                print("2 - Portfolio analysis completed successfully")
+
+                # 3. Process news
+                news_summary = news_future.result()
 
             # 4. Generate decisions
             print("4 - Generating investment decisions...")
@@ -94,12 +105,7 @@ class PortfolioAIWorkflow:
                 "summary_path": report_info["summary_path"]
             }
             
-            self.last_run = run_log
-            self.run_history.append(run_log)
-            
-            # Save run history
-            with open(os.path.join(self.base_dir, "run_history.json"), "w", encoding="utf-8") as f:
-                json.dump(self.run_history, f, indent=2)
+            self._record_run(run_log)
             
             print(f"Workflow completed successfully in {duration:.2f} seconds")
             print(f"Reports saved to: {report_info['report_path']}")
@@ -119,24 +125,46 @@ class PortfolioAIWorkflow:
                 "error": str(e)
             }
             
-            self.last_run = error_log
-            self.run_history.append(error_log)
-            
-            # Save run history
-            with open(os.path.join(self.base_dir, "run_history.json"), "w", encoding="utf-8") as f:
-                json.dump(self.run_history, f, indent=2)
+            self._record_run(error_log)
             
             print(f"Workflow failed: {str(e)}")
             return f"ERROR: Portfolio AI workflow failed: {str(e)}"
     
+    def _record_run(self, run_log):
+        """Track a finished run and append it to the run history file"""
+        self.last_run = run_log
+        self.run_history.append(run_log)
+        self.run_history = self.run_history[-self.max_history:]
+        
+        # One JSON record per line, so each run only appends its own entry
+        with open(os.path.join(self.base_dir, "run_history.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(run_log) + "\n")
+    
+    def _process_news(self, news):
+        """Categorize and summarize fetched news"""
+        print("3 - Processing news...")
+        print("3.1 - Processing news...")
+        categorized_news = self.news_aggregator.fetch_and_categorize_news(news_items=news)
+        print("3.1 - News categorized successfully")
+        print("3.2 - Summarizing news...")
+        news_summary = self.news_aggregator.summarize_news(categorized_news)
+        print("3.2 - News summarized successfully")
+        print("3 - News processing completed successfully")
+        return news_summary
+    
     def schedule_daily_run(self, time_str="18:00"):
         """Schedule daily run at specific time"""
         schedule.every().day.at(time_str).do(self.run_daily_workflow)
         print(f"Scheduled daily workflow to run at {time_str}")
         
+        # Sleep straight through to the next job instead of polling
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(idle)
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
     
     def run_on_demand(self):
         """Run workflow immediately on demand"""
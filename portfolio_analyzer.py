@@ -2,9 +2,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
-import json
-import matplotlib.pyplot as plt
-import seaborn as sns
+import logging
+import threading
+from file_utils import atomic_write, dumps_json
+
+logger = logging.getLogger(__name__)
+
+# Resolution of the saved charts; enough for the PDF report at page width
+CHART_DPI = 72
 
 class PortfolioAnalyzer:
     def __init__(self, data_collector):
@@ -17,51 +22,92 @@ class PortfolioAnalyzer:
         self.results_dir = "analysis_results"
         self.nifty_data = data_collector.fetch_nifty_data("1y")
         os.makedirs(self.results_dir, exist_ok=True)
+        # Market figures every analysis compares against, derived once; left as None
+        # when the index could not be fetched (a failed fetch can be an empty frame)
+        self._nifty_returns = None
+        self._nifty_std = None
+        self._nifty_total_return = None
+        if self.nifty_data is not None and len(self.nifty_data) >= 2:
+            nifty_close = self.nifty_data["Close"]
+            self._nifty_returns = nifty_close.pct_change().dropna()
+            self._nifty_std = float(self._nifty_returns.std())
+            self._nifty_total_return = float(nifty_close.iloc[-1] / nifty_close.iloc[0] - 1)
+        # Holdings as contiguous arrays, built once per stock_data and holdings (see _holdings_matrices)
+        self._matrices = None
+        self._matrices_lock = threading.Lock()
+        # Last performance/contribution results with the stock data and portfolio
+        # entries they were computed from
+        self._performance_cache = None
+        self._contributions_cache = None
+    
+    def _holdings_matrices(self, stock_data):
+        """
+        Return (symbols, quantities, closes, returns) for the holdings present in
+        stock_data: symbols in holdings order, quantities as a float64 array, and
+        forward-filled close prices and per-stock daily returns as (dates x holdings) frames.
+        Built once and reused while the same stock_data object is analyzed with
+        unchanged holdings.
+        """
+        holdings_key = tuple(self.portfolio.get("holdings", {}).items())
+        with self._matrices_lock:
+            if self._matrices is not None and self._matrices[0] is stock_data and self._matrices[1] == holdings_key:
+                return self._matrices[2:]
+            
+            holdings = {symbol: quantity for symbol, quantity in holdings_key if symbol in stock_data}
+            symbols = list(holdings)
+            quantities = np.fromiter(holdings.values(), dtype=np.float64, count=len(holdings))
+            # Gaps carry the last known price
+            closes = pd.concat({symbol: stock_data[symbol]["Close"] for symbol in symbols}, axis=1).ffill()
+            # Returns come from each stock's own observations, so a day it did not
+            # trade (e.g. a halt) is a gap rather than a filled-in 0% return
+            returns = pd.concat({symbol: stock_data[symbol]["Close"].dropna().pct_change() for symbol in symbols},
+                                axis=1)
+            
+            self._matrices = (stock_data, holdings_key, symbols, quantities, closes, returns)
+            return self._matrices[2:]
     
     def calculate_portfolio_performance(self, stock_data=None, timeframe="1y"):
         """
         Calculate overall portfolio performance
         timeframe: Time period for performance calculation
         """
-        print("PotfolioAnalyser | Calculating portfolio performance...")
+        logger.info("PotfolioAnalyser | Calculating portfolio performance...")
         if stock_data is None:
             # Fetch stock data if not provided
             stock_data = self.data_collector.fetch_stock_data(timeframe)
 
-        portfolio_value_history = []
+        _, quantities, closes, _ = self._holdings_matrices(stock_data)
         
-        # Get date range from the first stock (assumes all stocks have same date range)
-        first_stock = list(stock_data.values())[0]
-        dates = first_stock.index
+        # The same stock data with the same holdings gives the same result, already
+        # saved to disk; prices are only compared by object, like _holdings_matrices
+        holdings_key = tuple(sorted(self.portfolio.get("holdings", {}).items()))
+        cached = self._performance_cache
+        if cached is not None and cached[0] is stock_data and cached[1] == holdings_key:
+            return cached[2]
         
-        # Calculate portfolio value for each date
-        for date in dates:
-            daily_value = 0
-            for symbol, quantity in self.portfolio.get("holdings", {}).items():
-                if symbol in stock_data and date in stock_data[symbol].index:
-                    price = stock_data[symbol].loc[date, "Close"]
-                    daily_value += price * quantity
-            
-            portfolio_value_history.append({
-                "date": date,
-                "value": daily_value
-            })
+        # Portfolio value for every date in one matrix-vector product; a holding
+        # counts as zero before its first price
+        prices = closes.fillna(0.0).to_numpy(dtype=np.float64)
+        values = prices @ quantities
         
-        # Convert to DataFrame
-        performance_df = pd.DataFrame(portfolio_value_history)
-        performance_df.set_index("date", inplace=True)
+        # Daily returns straight off the value array; the first day has none
+        daily_returns = np.full_like(values, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(values[1:], values[:-1], out=daily_returns[1:])
+        daily_returns[1:] -= 1.0
         
-        # Calculate daily returns
-        performance_df["daily_return"] = performance_df["value"].pct_change()
+        # Calculate cumulative returns by compounding the daily returns
+        cumulative_returns = np.cumprod(np.where(np.isnan(daily_returns), 1.0, 1.0 + daily_returns)) - 1.0
         
-        # Calculate cumulative returns
-        initial_value = performance_df["value"].iloc[0]
-        performance_df["cumulative_return"] = (performance_df["value"] / initial_value) - 1
+        performance_df = pd.DataFrame({"value": values,
+                                       "daily_return": daily_returns,
+                                       "cumulative_return": cumulative_returns}, index=closes.index)
+        performance_df.index.name = "date"
         
         # Additional metrics
-        total_return = performance_df["cumulative_return"].iloc[-1]
-        annualized_return = (1 + total_return) ** (365 / len(performance_df)) - 1
-        volatility = performance_df["daily_return"].std() * np.sqrt(252)  # Annualized volatility
+        total_return = float(cumulative_returns[-1])
+        annualized_return = (1 + total_return) ** (365 / len(values)) - 1
+        volatility = float(np.nanstd(daily_returns, ddof=1)) * np.sqrt(252)  # Annualized volatility
         sharpe_ratio = annualized_return / volatility  # Simplified Sharpe ratio (assuming 0 risk-free rate)
         
         performance_metrics = {
@@ -69,121 +115,132 @@ class PortfolioAnalyzer:
             "annualized_return": annualized_return,
             "volatility": volatility,
             "sharpe_ratio": sharpe_ratio,
-            "max_drawdown": self._calculate_max_drawdown(performance_df["value"])
+            "max_drawdown": self._calculate_max_drawdown(values)
         }
         
         # Save results
         performance_df.to_csv(os.path.join(self.results_dir, "portfolio_performance.csv"))
-        with open(os.path.join(self.results_dir, "performance_metrics.json"), "w", encoding="utf-8") as f:
-            json.dump(performance_metrics, f, indent=2)
+        atomic_write(os.path.join(self.results_dir, "performance_metrics.json"), dumps_json(performance_metrics, indent=2))
         
+        self._performance_cache = (stock_data, holdings_key, (performance_df, performance_metrics))
         return performance_df, performance_metrics
     
     def _calculate_max_drawdown(self, price_series):
         """Calculate maximum drawdown from a price series"""
-        print("PotfolioAnalyser | Calculating maximum drawdown...")
-        roll_max = price_series.cummax()
-        drawdown = (price_series / roll_max) - 1
-        return drawdown.min()
+        logger.debug("PotfolioAnalyser | Calculating maximum drawdown...")
+        values = np.asarray(price_series, dtype=np.float64)
+        # Running peak, then turned into the drawdown in place; one scratch array in all
+        drawdowns = np.maximum.accumulate(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(values, drawdowns, out=drawdowns)
+        drawdowns -= 1.0
+        # nanmin matches pandas, which skipped the 0/0 of leading zero values
+        return float(np.nanmin(drawdowns))
     
     def analyze_stock_contributions(self, stock_data=None):
         """Analyze how each stock contributes to portfolio performance and risk"""
-        print("PotfolioAnalyser | Analyzing stock contributions...")
+        logger.info("PotfolioAnalyser | Analyzing stock contributions...")
         if stock_data is None:
             # Fetch stock data if not provided
             stock_data = self.data_collector.fetch_stock_data("1y")
 
-        contributions = {}
+        symbols, quantities, closes, returns = self._holdings_matrices(stock_data)
 
-        # Calculate total investment based on initial prices(start of fetched data)
-        # total_investment = 0
-        # for symbol, quantity in self.portfolio.get("holdings", {}).items():
-        #     if symbol in stock_data:
-        #         initial_price = stock_data[symbol]["Close"].iloc[0]
-        #         total_investment += initial_price * quantity
-        
-        # Calculate total investment based on average buy cost basis (personalised)
-        total_investment = 0
-        for symbol, quantity in self.portfolio.get("holdings", {}).items():
-            if symbol in stock_data:
-                print(f"PotfolioAnalyser | Calculating initial investment for {symbol}...")
-                avg_buy_price = self.portfolio["avg_costs"].get(symbol)
-                initial_value = avg_buy_price * quantity
-                total_investment += initial_value
+        # The same stock data with the same holdings and costs gives the same result,
+        # already saved to disk; prices are only compared by object
+        portfolio_key = (tuple(sorted(self.portfolio.get("holdings", {}).items())),
+                         tuple(sorted(self.portfolio.get("avg_costs", {}).items())))
+        cached = self._contributions_cache
+        if cached is not None and cached[0] is stock_data and cached[1] == portfolio_key:
+            return cached[2]
 
-        for symbol, quantity in self.portfolio.get("holdings", {}).items():
-            if symbol in stock_data:
-                # Get latest price
-                latest_price = stock_data[symbol]["Close"].iloc[-1]
+        if self._nifty_returns is not None:
+            nifty_returns = self._nifty_returns
+            
+            # Pearson correlation of every holding with the market at once, each
+            # over the dates on which both have a return
+            aligned = returns.reindex(nifty_returns.index).to_numpy(dtype=np.float64)
+            market = nifty_returns.to_numpy(dtype=np.float64)[:, None]
+            valid = ~np.isnan(aligned)
+            overlaps = valid.sum(axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stock_dev = np.where(valid, aligned - np.where(valid, aligned, 0.0).sum(axis=0) / overlaps, 0.0)
+                market_dev = np.where(valid, market - np.where(valid, market, 0.0).sum(axis=0) / overlaps, 0.0)
+                correlations = (np.einsum("tn,tn->n", stock_dev, market_dev)
+                                / np.sqrt(np.einsum("tn,tn->n", stock_dev, stock_dev)
+                                          * np.einsum("tn,tn->n", market_dev, market_dev)))
+            betas = correlations * (returns.std().to_numpy() / self._nifty_std)
 
-                # Get initial price (start of fetched data), 
-                # else use average cost basis from avg_buy_price
-                # initial_price = stock_data[symbol]["Close"].iloc[0]
-                avg_buy_price = self.portfolio["avg_costs"].get(symbol)
-                initial_price = avg_buy_price
-                
-                # Calculate metrics
-                current_value = latest_price * quantity
-                # initial_value = initial_price * quantity
-                
-                initial_value = initial_price * quantity
+        # Position values and returns for all holdings at once; returns are measured
+        # against the average buy cost basis (personalised) rather than the first price
+        latest_prices = closes.iloc[-1].to_numpy()
+        avg_costs = np.array([self.portfolio.get("avg_costs", {}).get(symbol) for symbol in symbols], dtype=np.float64)
+        # Holdings without a usable average cost have no return on cost; they are
+        # reported as None and left out of the invested total
+        has_cost = avg_costs > 0
+        current_values = latest_prices * quantities
+        cost_basis = np.where(has_cost, avg_costs * quantities, 0.0)
+        
+        # Weight is each position's share of the current portfolio value
+        weights = current_values / current_values.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stock_returns = np.where(has_cost, latest_prices / avg_costs - 1, np.nan)
+            # Contributions are weighted by amount invested so they add up to the
+            # portfolio's return on cost
+            contributions_to_return = stock_returns * (cost_basis / cost_basis.sum())
 
-                weight = current_value / total_investment
-                print(f"PotfolioAnalyser | Calculating stock return for {symbol}...")
-                stock_return = (latest_price / initial_price) - 1
-                print(f"PotfolioAnalyser | Stock return for {symbol}: {stock_return:.2%}")
-                contribution_to_return = stock_return * weight
-                
-                print(f"PotfolioAnalyser | Calculating beta for {symbol}...")
+        # Financial metrics are network-bound; fetched once the numeric work is done
+        logger.info("PotfolioAnalyser | Fetching financial metrics...")
+        metrics_map = self.data_collector.fetch_financial_metrics_batch(symbols)
 
-                # Get stock beta (if available) or calculate
-                # For simplicity, we'll use correlation to Nifty as a proxy for beta
-                if self.nifty_data is not None:
-                    stock_returns = stock_data[symbol]["Close"].pct_change().dropna()
-                    nifty_returns = self.nifty_data["Close"].pct_change().dropna()
-                    
-                    # Align dates
-                    aligned_data = pd.concat([stock_returns, nifty_returns], axis=1).dropna()
-                    if not aligned_data.empty and len(aligned_data) > 30:  # Ensure enough data points
-                        correlation = aligned_data.iloc[:, 0].corr(aligned_data.iloc[:, 1])
-                        beta = correlation * (stock_returns.std() / nifty_returns.std())
-                    else:
-                        correlation = None
-                        beta = None
-                else:
-                    correlation = None
-                    beta = None
-                
-                # Get financial metrics
-                print(f"PotfolioAnalyser | Calculating financial metrics for {symbol}...")
-                metrics = self.data_collector.fetch_financial_metrics(symbol)
-                
-                # Store all data
-                contributions[symbol] = {
-                    "quantity": quantity,
-                    "current_price": round(latest_price, 2), 
-                    "current_value": round(current_value, 2),
-                    "weight": weight,
-                    "return": round(stock_return, 2),
-                    "contribution_to_return": round(contribution_to_return, 2),
-                    "correlation_to_market": correlation,
-                    "beta": beta,
-                    "financial_metrics": metrics
-                }
+        contributions = {}
+        for i, symbol in enumerate(symbols):
+            # Get stock beta (if available) or calculate
+            # For simplicity, we'll use correlation to Nifty as a proxy for beta
+            if self._nifty_returns is not None and overlaps[i] > 30:  # Ensure enough data points
+                correlation = float(correlations[i])
+                beta = float(betas[i])
+            else:
+                correlation = None
+                beta = None
+            
+            # Store all data
+            contributions[symbol] = {
+                "quantity": self.portfolio["holdings"][symbol],
+                "current_price": round(float(latest_prices[i]), 2), 
+                "current_value": round(float(current_values[i]), 2),
+                "weight": float(weights[i]),
+                "return": round(float(stock_returns[i]), 2) if has_cost[i] else None,
+                "contribution_to_return": round(float(contributions_to_return[i]), 2) if has_cost[i] else None,
+                "correlation_to_market": correlation,
+                "beta": beta,
+                "financial_metrics": metrics_map[symbol]
+            }
+        
+        # One line for all holdings, only formatted when someone is listening
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PotfolioAnalyser | Stock returns: %s",
+                         ", ".join(f"{symbol} {stock_return:.2%}" for symbol, stock_return in zip(symbols, stock_returns)))
         
         # Save results
-        with open(os.path.join(self.results_dir, "stock_contributions.json"), "w", encoding="utf-8") as f:
-            json.dump(contributions, f, indent=2)
+        atomic_write(os.path.join(self.results_dir, "stock_contributions.json"), dumps_json(contributions, indent=2))
 
-        print(f"PotfolioAnalyser | Stock contributions analysis complete. Found {len(contributions)} stocks.")
+        logger.info("PotfolioAnalyser | Stock contributions analysis complete. Found %d stocks.", len(contributions))
+        self._contributions_cache = (stock_data, portfolio_key, contributions)
         return contributions
     
-    def generate_optimization_suggestions(self, performance, contributions:dict, stock_data=None):
+    def generate_optimization_suggestions(self, performance=None, contributions:dict=None, stock_data=None):
         """
         Generate portfolio optimization suggestions based on analysis
         Uses simple rules for now - will be enhanced with LLM in the next module
+        performance, contributions: Results computed earlier in the run; only
+                                    recomputed when not provided
         """
-        print("PotfolioAnalyser | Generating optimization suggestions...")
+        logger.info("PotfolioAnalyser | Generating optimization suggestions...")
+        if performance is None:
+            performance = self.calculate_portfolio_performance(stock_data=stock_data)
+        if contributions is None:
+            contributions = self.analyze_stock_contributions(stock_data=stock_data)
         performance_df, metrics = performance
         
         # Simple rule-based suggestions
@@ -200,33 +257,32 @@ class PortfolioAnalyzer:
                     "severity": "medium"
                 })
 
-        nifty_prices = self.nifty_data["Close"]
-
         # 2. Check for underperforming stocks (negative return and underperforming market)
-        market_return = (nifty_prices.iloc[-1] / nifty_prices.iloc[0]) - 1
-        for symbol, data in contributions.items():
-            if data["return"] < 0 and data["return"] < market_return - 0.05:
-                suggestions.append({
-                    "type": "Performance",
-                    "symbol": symbol,
-                    "action": "Consider replacing or reducing",
-                    "reasoning": f"{symbol} has returned {data['return']:.1%}, underperforming the market by {market_return - data['return']:.1%}.",
-                    "severity": "high" if data["return"] < -0.10 else "medium"
-                })
+        market_return = self._nifty_total_return
+        if market_return is not None:
+            for symbol, data in contributions.items():
+                if data["return"] is not None and data["return"] < 0 and data["return"] < market_return - 0.05:
+                    suggestions.append({
+                        "type": "Performance",
+                        "symbol": symbol,
+                        "action": "Consider replacing or reducing",
+                        "reasoning": f"{symbol} has returned {data['return']:.1%}, underperforming the market by {market_return - data['return']:.1%}.",
+                        "severity": "high" if data["return"] < -0.10 else "medium"
+                    })
         
         # 3. Check for potential sector rebalancing
         # (This would require sector information - simplified here)
         
         # 4. Correlation/diversification checks
-        high_correlation_pairs = []
         symbols = list(contributions.keys())
-        for i in range(len(symbols)):
-            for j in range(i+1, len(symbols)):
-                sym1, sym2 = symbols[i], symbols[j]
-                corr1 = contributions[sym1].get("correlation_to_market")
-                corr2 = contributions[sym2].get("correlation_to_market")
-                if corr1 and corr2 and abs(corr1 - corr2) < 0.2:
-                    high_correlation_pairs.append((sym1, sym2))
+        # Missing (or zero) correlations become NaN so they never form a pair
+        corrs = np.array([contributions[symbol].get("correlation_to_market") or np.nan for symbol in symbols],
+                         dtype=np.float64)
+        # Compare every pair at once; upper triangle keeps each pair once, in order
+        close = np.abs(corrs[:, None] - corrs[None, :]) < 0.2
+        rows, cols = np.triu_indices(len(symbols), k=1)
+        paired = close[rows, cols]
+        high_correlation_pairs = [(symbols[i], symbols[j]) for i, j in zip(rows[paired], cols[paired])]
         
         if high_correlation_pairs:
             suggestions.append({
@@ -248,67 +304,83 @@ class PortfolioAnalyzer:
             })
         
         # Save suggestions
-        with open(os.path.join(self.results_dir, "optimization_suggestions.json"), "w", encoding="utf-8") as f:
-            json.dump(suggestions, f, indent=2)
+        atomic_write(os.path.join(self.results_dir, "optimization_suggestions.json"), dumps_json(suggestions, indent=2))
         
         return suggestions
     
     def visualize_portfolio(self, contributions=None, performance=None):
-        """Create visualizations of portfolio composition and performance"""
-        print("PotfolioAnalyser | Generating visualizations...")
+        """
+        Create visualizations of portfolio composition and performance
+        contributions, performance: Results computed earlier in the run; only
+                                    recomputed when not provided
+        """
+        logger.info("PotfolioAnalyser | Generating visualizations...")
         if contributions is None:
             contributions = self.analyze_stock_contributions()
         if performance is None:
-            performance_df, _ = self.calculate_portfolio_performance()
+            performance = self.calculate_portfolio_performance()
         
         performance_df, _ = performance
         
+        # matplotlib is slow to import and only needed here. The charts are only
+        # written to files, so draw on a bare Agg-backed Figure without pyplot's
+        # global figure registry or backend selection.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        # One figure is cleared and reused for every chart instead of building a new one each time
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        
         # 1. Portfolio composition pie chart
-        plt.figure(figsize=(10, 6))
+        fig.set_size_inches(10, 6)
+        ax = fig.add_subplot()
         labels = [f"{symbol} ({data['weight']:.1%})" for symbol, data in contributions.items()]
         sizes = [data["weight"] for symbol, data in contributions.items()]
-        plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
-        plt.axis('equal')
-        plt.title('Portfolio Composition')
-        plt.savefig(os.path.join(self.results_dir, "portfolio_composition.png"))
-        plt.close()
+        # The labels already carry each weight, so skip autopct's second text per wedge
+        ax.pie(sizes, labels=labels, startangle=90, textprops={"fontsize": 8})
+        ax.axis('equal')
+        ax.set_title('Portfolio Composition')
+        fig.savefig(os.path.join(self.results_dir, "portfolio_composition.png"), dpi=CHART_DPI)
         
         # 2. Performance over time
-        plt.figure(figsize=(12, 6))
-        plt.plot(performance_df.index, performance_df["cumulative_return"] * 100)
-        plt.title('Portfolio Cumulative Return (%)')
-        plt.xlabel('Date')
-        plt.ylabel('Return (%)')
-        plt.grid(True)
-        plt.savefig(os.path.join(self.results_dir, "portfolio_performance.png"))
-        plt.close()
+        fig.clear()
+        fig.set_size_inches(12, 6)
+        ax = fig.add_subplot()
+        ax.plot(performance_df.index, performance_df["cumulative_return"] * 100)
+        ax.set_title('Portfolio Cumulative Return (%)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Return (%)')
+        ax.grid(True)
+        fig.savefig(os.path.join(self.results_dir, "portfolio_performance.png"), dpi=CHART_DPI)
         
         # 3. Individual stock returns comparison
-        plt.figure(figsize=(12, 8))
-        returns = []
-        symbols = []
-        for symbol, data in contributions.items():
-            returns.append(data["return"] * 100)
-            symbols.append(symbol)
+        fig.clear()
+        fig.set_size_inches(12, 8)
+        ax = fig.add_subplot()
+        # Holdings without a cost basis have no return to show
+        charted = {symbol: data["return"] for symbol, data in contributions.items() if data["return"] is not None}
+        returns = np.fromiter(charted.values(), dtype=np.float64, count=len(charted))
+        symbols = np.array(list(charted))
         
         # Sort by return
-        sorted_indices = np.argsort(returns)
-        returns = [returns[i] for i in sorted_indices]
-        symbols = [symbols[i] for i in sorted_indices]
+        order = returns.argsort()
+        returns = returns[order] * 100
+        symbols = symbols[order]
         
-        colors = ['g' if r >= 0 else 'r' for r in returns]
-        plt.barh(symbols, returns, color=colors)
-        plt.axvline(x=0, color='black', linestyle='-', alpha=0.3)
-        plt.title('Individual Stock Returns (%)')
-        plt.xlabel('Return (%)')
-        plt.grid(True, axis='x')
-        plt.savefig(os.path.join(self.results_dir, "stock_returns.png"))
-        plt.close()
+        colors = np.where(returns >= 0, 'g', 'r')
+        ax.barh(symbols, returns, color=colors)
+        ax.axvline(x=0, color='black', linestyle='-', alpha=0.3)
+        ax.set_title('Individual Stock Returns (%)')
+        ax.set_xlabel('Return (%)')
+        ax.grid(True, axis='x')
+        fig.savefig(os.path.join(self.results_dir, "stock_returns.png"), dpi=CHART_DPI)
         
         return "Visualizations saved to analysis_results directory"
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     from data_collector import DataCollector
     collector = DataCollector()
     analyzer = PortfolioAnalyzer(collector)
@@ -316,7 +388,7 @@ if __name__ == "__main__":
     # Run analysis
     performance = analyzer.calculate_portfolio_performance()
     contributions = analyzer.analyze_stock_contributions()
-    suggestions = analyzer.generate_optimization_suggestions()
-    visualizations = analyzer.visualize_portfolio()
+    suggestions = analyzer.generate_optimization_suggestions(performance, contributions)
+    visualizations = analyzer.visualize_portfolio(contributions, performance)
     
     print(f"PotfolioAnalyser | Analysis complete. Found {len(suggestions)} optimization suggestions.")
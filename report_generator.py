@@ -1,11 +1,10 @@
 import os
+import logging
 from datetime import datetime
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
 from fpdf import FPDF
-import base64
-from io import BytesIO
+from file_utils import atomic_write
+
+logger = logging.getLogger(__name__)
 
 class ReportGenerator:
     def __init__(self, portfolio_analyzer, news_aggregator, decision_engine):
@@ -23,7 +22,7 @@ class ReportGenerator:
     
     def generate_daily_report(self, performance, contributions, suggestions, news_summary, decision_report):
         """Generate a comprehensive daily report"""
-        print("ReportGenerator | Generating daily report...")
+        logger.info("ReportGenerator | Generating daily report...")
         today = datetime.now().strftime("%Y-%m-%d")
         
         # 1. Get all necessary data
@@ -36,23 +35,26 @@ class ReportGenerator:
         pdf.add_page()
         
         # Title
-        print("ReportGenerator | Generating PDF report...")
+        logger.info("ReportGenerator | Generating PDF report...")
         pdf.set_font("Arial", "B", 16)
         pdf.cell(190, 10, f"Portfolio Report - {today}", 0, 1, "C")
         
         # Performance metrics
-        print("ReportGenerator | Portfolio Performance")
+        logger.info("ReportGenerator | Portfolio Performance")
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Portfolio Performance", 0, 1, "L")
         pdf.set_font("Arial", "", 10)
-        pdf.multi_cell(190, 5, f"Total Return: {metrics['total_return']:.2%}")
-        pdf.multi_cell(190, 5, f"Annualized Return: {metrics['annualized_return']:.2%}")
-        pdf.multi_cell(190, 5, f"Volatility: {metrics['volatility']:.2%}")
-        pdf.multi_cell(190, 5, f"Sharpe Ratio: {metrics['sharpe_ratio']:.2f}")
-        pdf.multi_cell(190, 5, f"Maximum Drawdown: {metrics['max_drawdown']:.2%}")
+        # One multi_cell per block of same-font lines; FPDF lays out each line the same way
+        pdf.multi_cell(190, 5, "\n".join([
+            f"Total Return: {metrics['total_return']:.2%}",
+            f"Annualized Return: {metrics['annualized_return']:.2%}",
+            f"Volatility: {metrics['volatility']:.2%}",
+            f"Sharpe Ratio: {metrics['sharpe_ratio']:.2f}",
+            f"Maximum Drawdown: {metrics['max_drawdown']:.2%}"
+        ]))
         
         # Add portfolio composition image
-        print("ReportGenerator | Portfolio Composition")
+        logger.info("ReportGenerator | Portfolio Composition")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Portfolio Composition", 0, 1, "L")
@@ -61,7 +63,7 @@ class ReportGenerator:
             pdf.image(composition_path, x=10, y=30, w=170)
         
         # Performance chart
-        print("ReportGenerator | Performance Chart")
+        logger.info("ReportGenerator | Performance Chart")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Performance Chart", 0, 1, "L")
@@ -70,7 +72,7 @@ class ReportGenerator:
             pdf.image(performance_path, x=10, y=30, w=170)
         
         # Stock returns
-        print("ReportGenerator | Individual Stock Returns")
+        logger.info("ReportGenerator | Individual Stock Returns")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Individual Stock Returns", 0, 1, "L")
@@ -79,7 +81,7 @@ class ReportGenerator:
             pdf.image(returns_path, x=10, y=30, w=170)
         
         # Optimization suggestions
-        print("ReportGenerator | Optimization Suggestions")
+        logger.info("ReportGenerator | Optimization Suggestions")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Optimization Suggestions", 0, 1, "L")
@@ -88,12 +90,11 @@ class ReportGenerator:
             pdf.set_font("Arial", "B", 10)
             pdf.multi_cell(190, 5, f"{suggestion['type']} - {suggestion['symbol']} ({suggestion['severity']})")
             pdf.set_font("Arial", "", 10)
-            pdf.multi_cell(190, 5, f"Action: {suggestion['action']}")
-            pdf.multi_cell(190, 5, f"Reasoning: {suggestion['reasoning']}")
+            pdf.multi_cell(190, 5, f"Action: {suggestion['action']}\nReasoning: {suggestion['reasoning']}")
             pdf.ln(5)
         
         # News summary
-        print("ReportGenerator | News Summary:")
+        logger.info("ReportGenerator | News Summary:")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "News Summary", 0, 1, "L")
@@ -112,7 +113,7 @@ class ReportGenerator:
                 pdf.ln(3)
         
         # Decision report
-        print("ReportGenerator | Portfolio Decisions & Recommendations")
+        logger.info("ReportGenerator | Portfolio Decisions & Recommendations")
         pdf.add_page()
         pdf.set_font("Arial", "B", 14)
         pdf.cell(190, 10, "Portfolio Decisions & Recommendations", 0, 1, "L")
@@ -131,7 +132,7 @@ class ReportGenerator:
                 pdf.ln(3)
         
         # Save PDF
-        print("ReportGenerator | Saving PDF report...")
+        logger.info("ReportGenerator | Saving PDF report...")
         report_path = os.path.join(self.reports_dir, f"portfolio_report_{today}.pdf")
         pdf.output(report_path)
         
@@ -139,7 +140,7 @@ class ReportGenerator:
         top_reco = decision_report.split('\n\n')[1] if '\n\n' in decision_report else decision_report[:200]
         
         # Also create a simple text summary for email/messaging
-        print("ReportGenerator | Generating text summary...")
+        logger.info("ReportGenerator | Generating text summary...")
         text_summary = f"""
         PORTFOLIO REPORT SUMMARY - {today}
         
@@ -158,9 +159,8 @@ class ReportGenerator:
         """
         
         summary_path = os.path.join(self.reports_dir, f"summary_{today}.md")
-        print("ReportGenerator | Writing text summary...")
-        with open(summary_path, "w", encoding="utf-8") as f:
-            f.write(text_summary)
+        logger.info("ReportGenerator | Writing text summary...")
+        atomic_write(summary_path, text_summary)
         
         return {
             "report_path": report_path,
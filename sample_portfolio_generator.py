@@ -1,63 +1,51 @@
 # Create a sample portfolio.json file
+import os
+import sys
 import json
+from functools import lru_cache
+from file_utils import atomic_write
 
-sample_portfolio = {
-  "stocks": [
-    "RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK",
-    "HINDUNILVR", "KOTAKBANK", "ITC", "LT", "MARUTI"
-  ],
-  "holdings": {
-    "RELIANCE": 10,
-    "TCS": 15,
-    "INFY": 20,
-    "HDFCBANK": 25,
-    "ICICIBANK": 30,
-    "HINDUNILVR": 35,
-    "KOTAKBANK": 40,
-    "ITC": 45,
-    "LT": 50,
-    "MARUTI": 55
-  },
-  "company_names": {
-    "RELIANCE": "Reliance Industries Limited",
-    "TCS": "Tata Consultancy Services",
-    "INFY": "Infosys Limited",
-    "HDFCBANK": "HDFC Bank",
-    "ICICIBANK": "ICICI Bank",
-    "HINDUNILVR": "Hindustan Unilever Limited",
-    "KOTAKBANK": "Kotak Mahindra Bank",
-    "ITC": "ITC Limited",
-    "LT": "Larsen & Toubro Limited",
-    "MARUTI": "Maruti Suzuki India Limited"
-  },
-  "sectors": {
-    "RELIANCE": "Conglomerate - Energy, Retail, Telecom",
-    "TCS": "IT Services & Consulting",
-    "INFY": "IT Services & Consulting",
-    "HDFCBANK": "Private Sector Banking",
-    "ICICIBANK": "Private Sector Banking",
-    "HINDUNILVR": "FMCG - Consumer Goods",
-    "KOTAKBANK": "Private Sector Banking",
-    "ITC": "Conglomerate - FMCG, Hotels, Paperboards",
-    "LT": "Engineering & Construction",
-    "MARUTI": "Automobile - Passenger Vehicles"
-  },
-  "average_cost": {
-    "RELIANCE": 2500.00,
-    "TCS": 3500.00,
-    "INFY": 1500.00,
-    "HDFCBANK": 1600.00,
-    "ICICIBANK": 800.00,
-    "HINDUNILVR": 2500.00,
-    "KOTAKBANK": 1800.00,
-    "ITC": 300.00,
-    "LT": 2000.00,
-    "MARUTI": 7000.00
-  }
-}
+# One row per holding: (symbol, quantity, company name, sector, average cost)
+SAMPLE_HOLDINGS = (
+    ("RELIANCE", 10, "Reliance Industries Limited", "Conglomerate - Energy, Retail, Telecom", 2500.00),
+    ("TCS", 15, "Tata Consultancy Services", "IT Services & Consulting", 3500.00),
+    ("INFY", 20, "Infosys Limited", "IT Services & Consulting", 1500.00),
+    ("HDFCBANK", 25, "HDFC Bank", "Private Sector Banking", 1600.00),
+    ("ICICIBANK", 30, "ICICI Bank", "Private Sector Banking", 800.00),
+    ("HINDUNILVR", 35, "Hindustan Unilever Limited", "FMCG - Consumer Goods", 2500.00),
+    ("KOTAKBANK", 40, "Kotak Mahindra Bank", "Private Sector Banking", 1800.00),
+    ("ITC", 45, "ITC Limited", "Conglomerate - FMCG, Hotels, Paperboards", 300.00),
+    ("LT", 50, "Larsen & Toubro Limited", "Engineering & Construction", 2000.00),
+    ("MARUTI", 55, "Maruti Suzuki India Limited", "Automobile - Passenger Vehicles", 7000.00),
+)
 
-# Write to file
-with open("my-portfolio.json", "w", encoding="utf-8") as f:
-    json.dump(sample_portfolio, f, indent=2)
+@lru_cache(maxsize=None)
+def build_sample_portfolio():
+    """Build the sample portfolio dict (once; treat the result as read-only)"""
+    # The portfolio file keeps one mapping per field, so split the rows into columns
+    symbols, quantities, company_names, sectors, avg_costs = zip(*SAMPLE_HOLDINGS)
+    return {
+      "stocks": list(symbols),
+      "holdings": dict(zip(symbols, quantities)),
+      "company_names": dict(zip(symbols, company_names)),
+      "sectors": dict(zip(symbols, sectors)),
+      "avg_costs": dict(zip(symbols, avg_costs))
+    }
 
-print("Sample portfolio file created: portfolio.json")
+if __name__ == "__main__":
+    # Compact unless PORTFOLIO_PRETTY=1 asks for an indented, hand-editable file
+    if os.environ.get("PORTFOLIO_PRETTY") == "1":
+        json_options = {"indent": 2}
+    else:
+        json_options = {"separators": (",", ":")}
+
+    # Encode the whole document first so it goes out in one write, replacing any
+    # existing file atomically; durability is opt-in with PORTFOLIO_FSYNC=1.
+    # Non-ASCII names are written as UTF-8 rather than \u escapes.
+    payload = json.dumps(build_sample_portfolio(), ensure_ascii=False, **json_options).encode("utf-8")
+    path = "my-portfolio.json"
+    atomic_write(path, payload, fsync=os.environ.get("PORTFOLIO_FSYNC") == "1")
+
+    # Stay quiet when run from scripts unless PORTFOLIO_VERBOSE is set
+    if os.environ.get("PORTFOLIO_VERBOSE") or sys.stdout.isatty():
+        print(f"Sample portfolio file created: {path}")